@@ -104,9 +104,8 @@ class Nanoset(torch.utils.data.Dataset):
         """
         Build dataset index and dataset sample index
         """
-        # Compute samples per epoch and number of epochs
+        # Compute samples per epoch
         samples_per_epoch = sum(self.dataset_lengths)
-        num_epochs = int(self.train_split_num_samples / samples_per_epoch) + 1
         # Build the dataset indexes for 1 epoch
         dataset_index, dataset_sample_index = build_nanoset_index_helper(
             n_samples=samples_per_epoch, weights=self.dataset_weights, dataset_sizes=self.dataset_lengths
@@ -116,12 +115,9 @@ class Nanoset(torch.utils.data.Dataset):
         numpy_random_state.shuffle(dataset_index)
         numpy_random_state = np.random.RandomState(self.random_seed)
         numpy_random_state.shuffle(dataset_sample_index)
-        # Concatenate num_epochs the shuffled indexes
-        dataset_index = np.concatenate([dataset_index for _ in range(num_epochs)])
-        dataset_sample_index = np.concatenate([dataset_sample_index for _ in range(num_epochs)])
-        # Just keep the necessary samples
-        dataset_index = dataset_index[: self.train_split_num_samples]
-        dataset_sample_index = dataset_sample_index[: self.train_split_num_samples]
+        # Repeat the shuffled indexes across epochs, just keeping the necessary samples
+        dataset_index = np.resize(dataset_index, self.train_split_num_samples)
+        dataset_sample_index = np.resize(dataset_sample_index, self.train_split_num_samples)
 
         return dataset_index, dataset_sample_index
 
@@ -164,9 +160,14 @@ def build_nanoset_index_helper(
         # Convert sample index to float for comparison against weights
         sample_idx_float = max(sample_idx, 1.0)
 
-        # Find the dataset with the highest error
-        errors = weights * sample_idx_float - current_samples
-        max_error_index = np.argmax(errors)
+        # Find the dataset with the highest error, in a single pass without allocating an errors array
+        max_error_index = 0
+        max_error = weights[0] * sample_idx_float - current_samples[0]
+        for dataset_idx in range(1, len(weights)):
+            error = weights[dataset_idx] * sample_idx_float - current_samples[dataset_idx]
+            if error > max_error:
+                max_error_index = dataset_idx
+                max_error = error
 
         # Assign the dataset index and update the sample index
         dataset_index[sample_idx] = max_error_index
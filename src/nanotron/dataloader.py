@@ -1,4 +1,5 @@
 import dataclasses
+import itertools
 import warnings
 from typing import Dict, Generator, Iterator, List, Optional, Union
 
@@ -44,8 +45,12 @@ def sanity_check_dataloader(
     config: Config,
 ) -> Iterator[Dict[str, Union[torch.Tensor, TensorPointer]]]:
     for batch in dataloader:
+        # NOTE: batches come from pinned memory (`pin_memory=True` in the dataloaders), so the host to device copy
+        # can be issued asynchronously. Anything consuming these tensors runs on the same stream, after the copy.
         micro_batch = {
-            k: v if isinstance(v, TensorPointer) else v.to("cuda", memory_format=torch.contiguous_format)
+            k: v
+            if isinstance(v, TensorPointer)
+            else v.to("cuda", memory_format=torch.contiguous_format, non_blocking=True)
             for k, v in batch.items()
         }
 
@@ -289,9 +294,12 @@ def clm_process(
     """Concatenate all texts from raw_dataset and generate chunks of `sequence_length + 1`, where chunks overlap by a single token."""
     # Adapted from https://github.com/huggingface/transformers/blob/47e1676255e5dd86b9541f734cd4f4bdcbb50f4a/examples/pytorch/language-modeling/run_clm.py#L391-L439
 
-    def group_texts(examples: Dict[str, List[np.ndarray]]) -> Dict[str, List[np.ndarray]]:
-        # Concatenate all texts.
-        concatenated_examples = {k: np.concatenate(v) for k, v in examples.items()}
+    def group_texts(examples: Dict[str, List[List[int]]]) -> Dict[str, List[np.ndarray]]:
+        # Concatenate all texts directly into a single contiguous buffer, without materializing one array per text.
+        concatenated_examples = {
+            k: np.fromiter(itertools.chain.from_iterable(v), dtype=np.int64, count=sum(map(len, v)))
+            for k, v in examples.items()
+        }
         total_length = len(concatenated_examples[next(iter(examples.keys()))])
         # WARNING: We drop the small remainder, we could add padding if the model supported it instead of this drop, you can
         # customize this part to your needs.
@@ -308,8 +316,7 @@ def clm_process(
 
     def _tokenize_and_group_texts(texts: List[str]) -> Dict[str, List[np.ndarray]]:
         tokenized_batch = tokenizer.batch_encode_plus(texts, return_attention_mask=False, return_token_type_ids=False)
-        tokenized_batch = {k: [np.array(tokenized_texts) for tokenized_texts in v] for k, v in tokenized_batch.items()}
-        return group_texts(tokenized_batch)
+        return group_texts(dict(tokenized_batch))
 
     train_dataset = raw_dataset.map(
         _tokenize_and_group_texts,